@@ -1,6 +1,3 @@
-import typeguard
-
-
 class StandardException(BaseException):
     def __init__(self, message: str, filename: str = "", lineno: int = -1):
         super().__init__(message)
@@ -1,18 +1,24 @@
 import typing
 
 
+# Method markers, stored as bits of a single "__strict_flags__" integer on the function.
+_VIRTUAL_METHOD_FLAG = 1
+_ABSTRACT_METHOD_FLAG = 2
+_OVERRIDE_METHOD_FLAG = 4
+
+
 def virtual_method(f: typing.Callable) -> typing.Callable:
-    f.__is_virtual__ = True
+    f.__strict_flags__ = getattr(f, "__strict_flags__", 0) | _VIRTUAL_METHOD_FLAG
     return f
 
 
 def abstract_method(f: typing.Callable) -> typing.Callable:
-    f.__is_abstract__ = True
+    f.__strict_flags__ = getattr(f, "__strict_flags__", 0) | _ABSTRACT_METHOD_FLAG
     return f
 
 
 def override_method(f: typing.Callable) -> typing.Callable:
-    f.__is_override__ = True
+    f.__strict_flags__ = getattr(f, "__strict_flags__", 0) | _OVERRIDE_METHOD_FLAG
     return f
 
 
@@ -1,17 +1,54 @@
-import builtins
 import functools
 import inspect
 import typing
 import re
 import enum
+import sys
+import types
 import warnings
-
-import typeguard
+import weakref
 
 from std.exceptions import *
+from std.functions import _VIRTUAL_METHOD_FLAG, _ABSTRACT_METHOD_FLAG, _OVERRIDE_METHOD_FLAG
 from std.types import *
 
 
+# Types that also accept other types (the same promotions typeguard applies).
+_PROMOTED_TYPES = {
+    float: (float, int),
+    complex: (complex, float, int),
+    bytes: (bytes, bytearray, memoryview),
+}
+
+# Types that can't be subclassed, so their instances are matched by an identity check alone.
+_FINAL_TYPES = frozenset({bool, types.NoneType, types.EllipsisType, types.NotImplementedType, range, slice})
+
+# Private (name mangled) member names, ie "_Type__member".
+_PRIVATE_IDENTIFIER_REGEX = re.compile(r"^_[a-zA-Z0-9_]+[a-zA-Z0-9]__")
+
+# Methods to not wrap, to avoid recursion.
+_IGNORE_METHOD_NAMES = frozenset({"__getattr__", "__setattr__", "__delattr__", "__getattribute__"})
+
+# Parameters that must not be annotated (and aren't type checked).
+_VAR_PARAMETER_KINDS = frozenset({inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD})
+_IGNORED_PARAMETER_NAMES = frozenset({"self", "cls"})
+
+# Parameters that can be given positionally / by keyword.
+_POSITIONAL_PARAMETER_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+_KEYWORD_PARAMETER_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+
+# The class owning each method's code object (weakly referenced), or None for code shared by several classes, keyed by
+# the code object's identity: equal code objects can come from different modules (see "_register_class_code").
+_CODE_OWNERS: dict[int, weakref.ref | None] = {}
+
+# The number of caller classes whose access decisions are cached per class, before the cache is cleared (see
+# "_BaseObject.__getattribute__").
+_ACCESS_DECISIONS_LIMIT = 1024
+
+# The values "_cached_on" stores on classes and functions.
+_CACHED_ATTRIBUTE_NAMES = frozenset({"__strict_type_hints__", "__strict_attributes__", "__strict_signature__"})
+
+
 class ErrorLevel(enum.Enum):
     WARNING = "WARNING"
     ERROR = "ERROR"
@@ -21,10 +58,14 @@ def enable_type_checking(error_level: ErrorLevel = ErrorLevel.ERROR) -> None:
     """
     Enable the type checking options by allowing the BaseObject to be used. By default, the BaseObject type aliases
     "object", to avoid the slowdown of type checking. This function can be called to enable the BaseObject type checking
-    by mapping BaseObject to the "_BaseObject" type.
+    by mapping BaseObject to the "_BaseObject" type. Running Python optimized ("python -O") leaves it disabled, so the
+    same code runs without any checks (or their overhead) in release builds.
     @return:
     """
 
+    if sys.flags.optimize:
+        return
+
     assert TypeChecker.BaseObject is object, "Type checking is already enabled."
     TypeChecker.BaseObject = _BaseObject
     TypeChecker.ErrorLevel = error_level
@@ -37,6 +78,152 @@ def _handle_error(error: BaseException) -> None:
     warnings.warn(str(error))
 
 
+def _handle_type_mismatch(method_name: str, description: str, value: Any, annotation: Any) -> None:
+    """
+    Report a method's argument or return value not matching its annotation. Only called once a check has failed, so
+    the message is only formatted for mismatches.
+    @param method_name: The qualified name of the method.
+    @param description: What the value is ("Argument" or "Return value").
+    @param value: The mismatching value.
+    @param annotation: The annotation the value doesn't match.
+    """
+    _handle_error(TypeMismatchException(f"{method_name}: {description} '{value}' is not of type '{_type_name(annotation)}'."))
+
+
+def _cached_on(obj: type | Callable, name: str, compute: Callable[[Any], Any]) -> Any:
+    """
+    Get a value computed from a class or function, computed once and stored on the object itself (in its own "__dict__",
+    so subclasses don't inherit it). Unlike a module-level cache, this doesn't keep classes created at runtime (and their
+    methods) alive, even when the value refers back to them. Other callables are computed every time.
+    @param obj: The class or function to compute the value from.
+    @param name: The attribute name to store the value under.
+    @param compute: The function computing the value from the object.
+    @return: The (cached) value.
+    """
+
+    if not isinstance(obj, (type, types.FunctionType)):
+        return compute(obj)
+
+    try:
+        return obj.__dict__[name]
+    except KeyError:
+        value = compute(obj)
+        setattr(obj, name, value)
+        return value
+
+
+def _type_hints(obj: type | Callable) -> dict[str, Any]:
+    """
+    Get the resolved type hints of a class or function. Annotations are static once the class or function has been
+    created, so the (expensive) resolution is done once per object, on first use (so forward references to classes
+    defined later still resolve), and shared by everything that needs it.
+    @param obj: The class or function to get the type hints of.
+    @return: The resolved type hints (must not be mutated).
+    """
+    return _cached_on(obj, "__strict_type_hints__", typing.get_type_hints)
+
+
+def _class_attributes(cls: type) -> dict[str, tuple[Any, Callable[[Any], bool] | None, bool]]:
+    """
+    Get everything assigning an attribute of a class needs (annotation, type checker and whether it's const), built once
+    per class from its type hints, so an assignment is a single lookup.
+    @param cls: The class to get the attributes of.
+    @return: The annotation, type checker (None if no check is needed) and const flag of each attribute, by name.
+    """
+    return _cached_on(cls, "__strict_attributes__", _collect_class_attributes)
+
+
+def _collect_class_attributes(cls: type) -> dict[str, tuple[Any, Callable[[Any], bool] | None, bool]]:
+    """
+    Build the attribute information of a class (see "_class_attributes"). Const attributes are checked against the type
+    they wrap (typeguard accepts any value for typing.Final[T]).
+    @param cls: The class to build the attribute information of.
+    @return: The annotation, type checker (None if no check is needed) and const flag of each attribute, by name.
+    """
+
+    attributes = {}
+    for attribute_name, attribute_type in _type_hints(cls).items():
+        checked_type = attribute_type
+        is_const = typing.get_origin(attribute_type) is Const
+        if is_const or attribute_type is Const:
+            checked_type = next(iter(typing.get_args(attribute_type)), Any)
+        attributes[attribute_name] = (attribute_type, _make_type_checker(checked_type), is_const)
+    return attributes
+
+
+def _get_signature(function: Callable) -> inspect.Signature:
+    """
+    Get the signature of a function, computed once per function. The metaclass and the method checker both need it, so
+    the (slow) signature construction is shared between them.
+    @param function: The function to get the signature of.
+    @return: The signature of the function.
+    """
+    return _cached_on(function, "__strict_signature__", inspect.signature)
+
+
+def _is_plain_class(annotation: Any) -> bool:
+    """
+    Check if an annotation is a plain class, that can be checked with "isinstance" (not a parameterized generic, protocol
+    or typed dict).
+    @param annotation: The annotation to check.
+    @return: True if the annotation is a plain class, False otherwise.
+    """
+    return isinstance(annotation, type) and typing.get_origin(annotation) is None and not getattr(annotation, "_is_protocol", False) and not typing.is_typeddict(annotation)
+
+
+def _type_name(annotation: Any) -> str:
+    """
+    Get the name of an annotation for error messages (unions, ie "int | None", have no "__name__").
+    @param annotation: The annotation to get the name of.
+    @return: The name of the annotation.
+    """
+    return getattr(annotation, "__name__", str(annotation))
+
+
+def _make_type_checker(annotation: Any) -> Callable[[Any], bool] | None:
+    """
+    Build a predicate checking a value against an annotation, once, so the per-call check doesn't re-dispatch on the
+    annotation. Plain classes, and unions (incl. optionals) of them, are checked with "isinstance" (with the same
+    numeric/bytes promotions as typeguard), and everything else (generics, protocols, ...) is handed to typeguard.
+    @param annotation: The resolved annotation to check values against.
+    @return: The predicate, or None if every value matches the annotation (Any / object).
+    """
+
+    if annotation is Any or annotation is object:
+        return None
+
+    # Plain classes only need an isinstance check, after an identity check for values of exactly the annotated class.
+    if _is_plain_class(annotation):
+        if annotation in _FINAL_TYPES:
+            return lambda value: type(value) is annotation
+        accepted_types = _PROMOTED_TYPES.get(annotation, annotation)
+        return lambda value: type(value) is annotation or isinstance(value, accepted_types)
+
+    # Unions of plain classes (ie "Optional[int]" or "int | str") only need an isinstance check against all the members.
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        union_members = typing.get_args(annotation)
+        if Any in union_members or object in union_members:
+            return None
+        if all(map(_is_plain_class, union_members)):
+            accepted_types = tuple(t for member in union_members for t in _PROMOTED_TYPES.get(member, (member,)))
+            if _FINAL_TYPES.issuperset(accepted_types):
+                return lambda value: type(value) in accepted_types
+            return lambda value: type(value) in accepted_types or isinstance(value, accepted_types)
+
+    # Only imported here, as it is only needed for annotations "isinstance" can't handle (and is slow to import).
+    import typeguard
+
+    # Annotations are already resolved, so one memo (normally built from the caller's frame per check) is reused.
+    memo = typeguard.TypeCheckMemo(globals={}, locals={})
+
+    def _check(value: Any) -> bool:
+        try: typeguard.check_type_internal(value, annotation, memo)
+        except typeguard.TypeCheckError: return False
+        return True
+
+    return _check
+
+
 def _method_type_checker(method: Callable | MethodType) -> Callable:
     """
     Check at runtime, every invocation of this function has arguments of the correct type (match parameters), and the
@@ -45,36 +232,75 @@ def _method_type_checker(method: Callable | MethodType) -> Callable:
     @return: A wrapper function that checks the types of the arguments and return value.
     """
 
-    @functools.wraps(method)
+    # A method with no annotations at all (only allowed when errors are downgraded) has nothing to check, so it doesn't
+    # need a wrapper.
+    if not getattr(method, "__annotations__", None):
+        return method
+
+    # Everything derivable from the function object itself is computed once, at decoration time.
+    method_name = method.__qualname__
+    method_signature = _get_signature(method)
+    method_parameters = method_signature.parameters
+    positional_names = tuple(p_name for p_name, p in method_parameters.items() if p.kind in _POSITIONAL_PARAMETER_KINDS)
+    has_var_positional = any(p.kind is inspect.Parameter.VAR_POSITIONAL for p in method_parameters.values())
+
+    # Annotations are resolved on the first call, as forward references may not be resolvable at decoration time. The
+    # checkers are stored per positional argument (None for unchecked ones) and per keyword argument name.
+    positional_checkers: tuple | None = None
+    keyword_checkers: dict[str, tuple[Any, Callable[[Any], bool]]] = {}
+    mismatching_defaults: tuple[tuple[str, int, Any, Any], ...] = ()
+    return_type: Any = None
+    return_checker: Callable[[Any], bool] | None = None
+
+    @functools.wraps(method, updated=())
     def _impl(*fn_args, **fn_kwargs) -> Any:
-        # Check the arguments' annotations.
-        method_name = f"{method.__qualname__}"
-        method_annotations = typing.get_type_hints(method)
-        method_signature   = inspect.signature(method)
-
-        # Re-arrange the arguments based on the method signature.
-        bound_arguments = method_signature.bind(*fn_args, **fn_kwargs)
-        bound_arguments.apply_defaults()
-        ordered_arguments = [bound_arguments.arguments[p] for p in method_signature.parameters]
-
-        # Pop the self argument for non-static methods.
-        if dict(method_signature.parameters).get("self") is not None:
-            ordered_arguments.pop(0)
-
-        # Check the arguments' types, skipping ignored parameters (self, *args, **kwargs)
-        for arg, param_type in zip(ordered_arguments, method_annotations.values()):
-            if param_type is type(None): continue
-            try: typeguard.check_type(arg, param_type)
-            except typeguard.TypeCheckError: _handle_error(TypeMismatchException(f"{method_name}: Argument '{arg}' is not of type '{param_type.__name__}'."))
+        nonlocal positional_checkers, keyword_checkers, mismatching_defaults, return_type, return_checker
+
+        # Resolve the annotations into (type, checker) entries; unchecked annotations (Any / object) are dropped.
+        if positional_checkers is None:
+            method_annotations = _type_hints(method)
+            return_type = method_annotations.get("return", Any)
+            return_checker = _make_type_checker(return_type)
+            argument_checkers = {
+                p_name: (p_type, checker) for p_name, p_type in method_annotations.items()
+                if p_name != "return" and (checker := _make_type_checker(p_type)) is not None}
+
+            keyword_checkers = {p_name: entry for p_name, entry in argument_checkers.items() if method_parameters[p_name].kind in _KEYWORD_PARAMETER_KINDS}
+
+            # Default values are constant, so they are checked once here. Only the mismatching ones are kept (with their
+            # positional index, or -1 for keyword only parameters), to be reported by the calls that use them.
+            mismatching_defaults = tuple(
+                (p_name, positional_names.index(p_name) if p_name in positional_names else -1, default, param_type)
+                for p_name, (param_type, checker) in argument_checkers.items()
+                if (default := method_parameters[p_name].default) is not inspect.Parameter.empty and not checker(default))
+            positional_checkers = tuple(argument_checkers.get(p_name) for p_name in positional_names) if argument_checkers else ()
+
+        # Check the arguments' types, positionally then by keyword, without binding them to the signature. Ignored
+        # parameters (self, *args, **kwargs) have no annotation, so no checker. Too many positional arguments are left to
+        # "bind" to report, before any argument is checked.
+        if positional_checkers or keyword_checkers:
+            if len(fn_args) > len(positional_names) and not has_var_positional:
+                method_signature.bind(*fn_args, **fn_kwargs)
+            for arg, entry in zip(fn_args, positional_checkers):
+                if entry is not None and not entry[1](arg):
+                    _handle_type_mismatch(method_name, "Argument", arg, entry[0])
+            for p_name, arg in fn_kwargs.items():
+                if (entry := keyword_checkers.get(p_name)) is not None and not entry[1](arg):
+                    _handle_type_mismatch(method_name, "Argument", arg, entry[0])
+            for p_name, p_index, default, param_type in mismatching_defaults:
+                if not -1 < p_index < len(fn_args) and p_name not in fn_kwargs:
+                    _handle_type_mismatch(method_name, "Argument", default, param_type)
 
         # Call the method and check the return type.
         result = method(*fn_args, **fn_kwargs)
-        return_type = method_annotations["return"]
 
-        try: typeguard.check_type(result, return_type)
-        except typeguard.TypeCheckError: _handle_error(TypeMismatchException(f"{method_name}: Return value '{result}' is not of type '{return_type.__name__}'."))
+        if return_checker is not None and not return_checker(result):
+            _handle_type_mismatch(method_name, "Return value", result, return_type)
         return result
 
+    # Copy the method's attributes (ie its marker flags), but not the values cached on it, which belong to the method.
+    _impl.__dict__.update((k, v) for k, v in method.__dict__.items() if k not in _CACHED_ATTRIBUTE_NAMES)
+    _impl.__strict_wrapped__ = True
     return _impl
 
 
@@ -84,7 +310,118 @@ def _is_special_identifier(identifier: str) -> bool:
     @param identifier: The identifier to check.
     @return: True if the identifier is a special identifier, False otherwise.
     """
-    return identifier.startswith("__") and identifier.endswith("__")
+    return len(identifier) >= 4 and identifier[0] == "_" and identifier[1] == "_" and identifier[-1] == "_" and identifier[-2] == "_"
+
+
+@functools.lru_cache(maxsize=None)
+def _translate_name(private_prefix: str, identifier: str) -> str:
+    """
+    Translate a (possibly private) member name to the name mangled for a class, ie "_Other__member" to "_Type__member".
+    @param private_prefix: The private prefix of the class, ie "_Type__".
+    @param identifier: The member name to translate.
+    @return: The translated member name.
+    """
+    if identifier.startswith(private_prefix):
+        return identifier
+    return _PRIVATE_IDENTIFIER_REGEX.sub(private_prefix, identifier)
+
+
+def _resolve_member_access(this_class: type, item: str, caller_name: str, caller_module: str, caller_class: type | None) -> str | None:
+    """
+    Decide if a protected or private member can be accessed by a caller that isn't code defined in the class (or a base
+    class): the caller can be an instance of the class or a subclass, a friend class, a friend method or a friended free
+    function.
+    @param this_class: The class of the object whose member is accessed.
+    @param item: The name of the member to access.
+    @param caller_name: The name of the calling function.
+    @param caller_module: The name of the module the calling function is defined in.
+    @param caller_class: The class of the caller's "self", or None if the caller is a free function.
+    @return: The name of the member to read (translated for friends), or None if access is not allowed.
+    """
+
+    friends = this_class.__friends__
+    this_class_identifier = this_class.__private_prefix__
+
+    # Handle possible friended free function.
+    if caller_class is None:
+        module_friends = this_class.__friends_by_module__.get(caller_module, ())
+        if caller_name in friends or caller_name in module_friends:
+            return _translate_name(this_class_identifier, item)
+        return None
+
+    # Handle class access (matching class means access to all members).
+    if caller_class is this_class:
+        return item
+
+    # Handle possible subclass access (protected only); note private looks like "_Type__member".
+    if caller_class in this_class.__protected_bases__ and not item.startswith((this_class_identifier, "__")):
+        return item
+
+    # Handle possible friend class or friend method access (calling function belongs to a friend class, or is a friend
+    # method), with a single test of both names against the friends.
+    caller_context_class_name = caller_class.__name__
+    caller_context_method_name = f"{caller_context_class_name}.{caller_name}"
+    if not friends.isdisjoint((caller_context_class_name, caller_context_method_name)):
+        return _translate_name(this_class_identifier, item)
+    return None
+
+
+def _marker_flags(value: Any) -> int:
+    """
+    Get the marker flags set on a method by the method decorators. Marker decorators can be applied above or below
+    "@staticmethod" and "@classmethod", so the flags of the descriptor and its underlying function are combined.
+    @param value: The method, or static/class method descriptor.
+    @return: The method's marker flags.
+    """
+    return getattr(value, "__strict_flags__", 0) | getattr(getattr(value, "__func__", None), "__strict_flags__", 0)
+
+
+def _method_flags(cls: type) -> dict[str, int]:
+    """
+    Get the marker flags (virtual/abstract/override) of the methods defined in a class (not inherited ones). They are
+    stored on the class by the metaclass, and only collected here for other bases, ie mixins.
+    @param cls: The class to get the method flags of.
+    @return: The non-zero marker flags of the methods, by method name.
+    """
+
+    method_flags = cls.__dict__.get("__strict_method_flags__")
+    if method_flags is None:
+        method_flags = {}
+        for field_name, field_value in cls.__dict__.items():
+            if callable(getattr(field_value, "__func__", field_value)) and (flags := _marker_flags(field_value)):
+                method_flags[field_name] = flags
+    return method_flags
+
+
+def _register_class_code(cls: type) -> None:
+    """
+    Record a class as the owner of the code objects of the functions defined in its body (methods, static/class methods
+    and property accessors, unwrapped from any decorators). Code objects already owned by another live class, ie when a
+    factory function creates several classes from the same body, are marked as shared (no owner). Entries are removed
+    when their code object is garbage collected, so its identity can't be reused by other code.
+    @param cls: The class to record as the owner of its code.
+    """
+
+    for field_value in cls.__dict__.values():
+        field_value = getattr(field_value, "__func__", field_value)
+        if isinstance(field_value, property):
+            functions = (field_value.fget, field_value.fset, field_value.fdel)
+        elif isinstance(field_value, functools.cached_property):
+            functions = (field_value.func,)
+        else:
+            functions = (field_value,)
+
+        for function in functions:
+            code = getattr(inspect.unwrap(function), "__code__", None) if callable(function) else None
+            if not isinstance(code, types.CodeType):
+                continue
+            previous_owner = _CODE_OWNERS.get(id(code), False)
+            if previous_owner is False:
+                weakref.finalize(code, _CODE_OWNERS.pop, id(code), None)
+            if previous_owner is False or (previous_owner is not None and previous_owner() in (None, cls)):
+                _CODE_OWNERS[id(code)] = weakref.ref(cls)
+            else:
+                _CODE_OWNERS[id(code)] = None
 
 
 def _should_ignore_parameter(name: str, parameter: inspect.Parameter) -> bool:
@@ -94,70 +431,82 @@ def _should_ignore_parameter(name: str, parameter: inspect.Parameter) -> bool:
     @param parameter: The parameter object.
     @return: True if the parameter should be ignored, False otherwise.
     """
-    var_parameter_types = {inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD}
-    return parameter.kind in var_parameter_types or name == "self"
+    return parameter.kind in _VAR_PARAMETER_KINDS or name in _IGNORED_PARAMETER_NAMES
 
 
 class _BaseObjectMetaClass(type):
     """
     Compile time checks, such as annotation checking are done here. No class instantiation is needed for these tests to
     take place. There is no effect on runtime performance. Friend classes are inherited from superclasses.
-    1. Check all parameters, except "self", "*..." and "**..." arguments have type annotations.
-    2. Check "self", "*..." and "**..." arguments don't have type annotations (uniform coding).
+    1. Check all parameters, except "self", "cls", "*..." and "**..." arguments have type annotations.
+    2. Check "self", "cls", "*..." and "**..." arguments don't have type annotations (uniform coding).
     3. Check all methods have return type annotations.
     4. Check all attributes have type annotations.
     5. All overridden methods must be marked as "@abstract_method" or "@virtual_method".
     6. All overriding methods must be marked as "@override_method".
     7. All abstract methods must be implemented in derived classes.
+    Classes can opt in to storing their annotated attributes in "__slots__" with "class Type(BaseObject, slots=True)".
     """
 
-    def __new__(cls, name, bases, dictionary):
-
-        # Methods to not wrap, to avoid recursion.
-        ignore_method_names = {"__getattr__", "__setattr__", "__delattr__", "__getattribute__"}
+    def __new__(cls, name, bases, dictionary, slots: bool = False):
+        class_annotations = dictionary.get("__annotations__", {})
+        class_method_flags = {}
 
         # Analyse each member of the class.
         for field_name, field_value in dictionary.items():
 
-            if builtins.callable(field_value):
+            # Static and class methods are analysed (and wrapped) through their underlying function.
+            method_value = field_value
+            method_descriptor = type(field_value) if isinstance(field_value, (staticmethod, classmethod)) else None
+            if method_descriptor is not None:
+                field_value = field_value.__func__
+
+            if callable(field_value):
+                method_flags = _marker_flags(method_value)
+                if method_flags:
+                    class_method_flags[field_name] = method_flags
 
                 # Check methods for virtual/abstract/override issues.
-                for base_class in filter(lambda x: x is not _BaseObject, bases):
-                    if field_name in base_class.__dict__:
-                        if base_field_value := base_class.__dict__.get(field_name, None):
+                for base_class in bases:
+                    if base_class is _BaseObject:
+                        continue
+                    if base_class.__dict__.get(field_name) is not None:
 
-                            # Check if a method is overridden, it is virtual or abstract.
-                            if not hasattr(base_field_value, "__is_virtual__") and not hasattr(base_field_value, "__is_abstract__") and not _is_special_identifier(field_name):
-                                _handle_error(VirtualMethodException(f"Method '{base_class.__name__}.{field_name}' must be marked as '@virtual_method' or '@abstract_method'."))
+                        # Check if a method is overridden, it is virtual or abstract.
+                        if not _method_flags(base_class).get(field_name, 0) & (_VIRTUAL_METHOD_FLAG | _ABSTRACT_METHOD_FLAG) and not _is_special_identifier(field_name):
+                            _handle_error(VirtualMethodException(f"Method '{base_class.__name__}.{field_name}' must be marked as '@virtual_method' or '@abstract_method'."))
 
-                            # Check if a method is overriding, it is marked as override.
-                            if not hasattr(field_value, "__is_override__") and not _is_special_identifier(field_name):
-                                _handle_error(OverrideMethodException(f"Method '{name}.{field_name}' must be marked as '@override_method'."))
+                        # Check if a method is overriding, it is marked as override.
+                        if not method_flags & _OVERRIDE_METHOD_FLAG and not _is_special_identifier(field_name):
+                            _handle_error(OverrideMethodException(f"Method '{name}.{field_name}' must be marked as '@override_method'."))
 
                 # Check if an @override_method is overriding a method that doesn't exist.
-                if hasattr(field_value, "__is_override__") and not any(field_name in base_class.__dict__ for base_class in bases):
+                if method_flags & _OVERRIDE_METHOD_FLAG and not any(field_name in base_class.__dict__ for base_class in bases):
                     _handle_error(OverrideMethodException(f"Method '{name}.{field_name}' is marked as '@override_method', but no method to override exists."))
 
-                # Check the return type is annotated.
-                method_annotations = field_value.__annotations__.copy()
-                if method_annotations.pop("return", None) is None:
+                # Check the return type is annotated (an unquoted "-> None" annotation is stored as None).
+                if "return" not in field_value.__annotations__:
                     _handle_error(MissingReturnTypeAnnotationException(f"Method '{name}.{field_name}' has no return type annotation."))
 
-                # Check all the parameters are annotated.
-                method_parameters = dict(inspect.signature(field_value).parameters)
-                method_parameters = {k: v for k, v in method_parameters.items() if not _should_ignore_parameter(k, v)}
+                # Check all the parameters are annotated (the signature is shared with the checks below).
+                method_parameters = _get_signature(field_value).parameters
                 for p_name, p in method_parameters.items():
-                    if p.annotation is inspect.Parameter.empty:
+                    if not _should_ignore_parameter(p_name, p) and p.annotation is inspect.Parameter.empty:
                         _handle_error(MissingParameterTypeAnnotationException(f"Parameter '{p_name}' in method '{field_name}' has no type annotation."))
 
                 # Check no unnecessary annotations are present.
-                for p_name, p in inspect.signature(field_value).parameters.items():
+                for p_name, p in method_parameters.items():
                     if _should_ignore_parameter(p_name, p) and p.annotation is not inspect.Parameter.empty:
                         _handle_error(UnnecessaryParameterTypeAnnotationException(f"Parameter '{p_name}' in method '{field_name}' should not have a type annotation."))
 
-                # Wrap the function in the runtime checker.
-                if field_name not in ignore_method_names:
-                    dictionary[field_name] = _method_type_checker(field_value)
+                # Wrap the function in the runtime checker (functions already wrapped, ie reused from another class, are
+                # kept as they are), restoring the static/class method descriptor and its markers around the wrapper.
+                if field_name not in _IGNORE_METHOD_NAMES and not getattr(field_value, "__strict_wrapped__", False):
+                    wrapped_value = _method_type_checker(field_value)
+                    if method_descriptor is not None:
+                        wrapped_value = method_descriptor(wrapped_value)
+                        wrapped_value.__dict__.update(method_value.__dict__)
+                    dictionary[field_name] = wrapped_value
 
             # Property return type annotation check.
             elif isinstance(field_value, property):
@@ -171,20 +520,58 @@ class _BaseObjectMetaClass(type):
 
             # Attribute analysis code.
             else:
-                if not _is_special_identifier(field_name) and field_name not in dictionary.get("__annotations__", {}):
+                if not _is_special_identifier(field_name) and field_name not in class_annotations:
                     _handle_error(MissingAttributeTypeAnnotationException(f"Attribute '{name}.{field_name}' has no type annotation."))
 
         # Check all the abstract methods are implemented.
-        for base_class in filter(lambda x: x is not _BaseObject, bases):
-            for b_field_name, b_field_value in base_class.__dict__.items():
-                if builtins.callable(b_field_value) and hasattr(b_field_value, "__is_abstract__"):
-                    if b_field_name not in dictionary:
-                        _handle_error(AbstractMethodException(f"Abstract method '{base_class.__name__}.{b_field_name}' must be implemented in class {name}."))
+        for base_class in bases:
+            if base_class is _BaseObject:
+                continue
+            for b_field_name, b_method_flags in _method_flags(base_class).items():
+                if b_method_flags & _ABSTRACT_METHOD_FLAG and b_field_name not in dictionary:
+                    _handle_error(AbstractMethodException(f"Abstract method '{base_class.__name__}.{b_field_name}' must be implemented in class {name}."))
+
+        # Store the marker flags of the methods defined in this class, for the checks of its subclasses.
+        dictionary["__strict_method_flags__"] = class_method_flags
+
+        # Store the annotated attributes in slots if the class opts in (and doesn't declare its own). Slotted classes have
+        # no "__dict__" or "__weakref__", and can't be combined with other slotted bases, so this isn't the default.
+        # Attributes with a class-level value can't be slots, so they're stored in a "__dict__" instead.
+        if slots and "__slots__" not in dictionary:
+            attribute_names = [n for n in class_annotations if not _is_special_identifier(n) and not any(hasattr(b, n) for b in bases)]
+            slot_names = [n for n in attribute_names if n not in dictionary]
+            if len(slot_names) < len(attribute_names) and not any(b.__dictoffset__ for b in bases):
+                slot_names.append("__dict__")
+            dictionary["__slots__"] = tuple(slot_names)
 
         return super(_BaseObjectMetaClass, cls).__new__(cls, name, bases, dictionary)
 
-    def __init__(cls, name, bases, dictionary):
-        cls.__friends__ = cls.__friends__.union(*[base.__friends__ for base in bases if hasattr(base, "__friends__")])
+    def __init__(cls, name, bases, dictionary, slots: bool = False):
+        # Merge the inherited friends into an immutable set of interned names, as it is only read from here on.
+        friends = cls.__friends__.union(*[base.__friends__ for base in bases if hasattr(base, "__friends__")])
+        cls.__friends__ = frozenset(sys.intern(friend) for friend in friends)
+
+        # Index module-qualified friends ("module:function") by module, so free functions are matched with one lookup.
+        # Dotted entries name friend methods ("Type.method"), so they are not indexed.
+        friends_by_module = {}
+        for friend in cls.__friends__:
+            module_name, separator, function_name = friend.partition(":")
+            if separator:
+                friends_by_module.setdefault(module_name, set()).add(function_name)
+        cls.__friends_by_module__ = {module_name: frozenset(names) for module_name, names in friends_by_module.items()}
+
+        # The classes whose code may access this class' protected members (the MRO, without "object").
+        cls.__protected_bases__ = cls.__mro__[:-1]
+
+        # Record this class as the owner of its methods' code objects.
+        _register_class_code(cls)
+
+        # The prefix of this class' private (name mangled) members, ie "_Type__" (leading underscores are dropped).
+        cls.__private_prefix__ = sys.intern(f"_{name.lstrip('_')}__")
+
+        # The cached access decisions for members of this class, by caller class, module and name, and member name (see
+        # "_BaseObject.__getattribute__").
+        cls.__access_decisions__ = {}
         super(_BaseObjectMetaClass, cls).__init__(name, bases, dictionary)
 
 
@@ -199,7 +586,7 @@ class _BaseObject(metaclass=_BaseObjectMetaClass):
     """
 
     __friends__: set[str] = {"inspect._getmembers"}
-    __slots__ = {}
+    __slots__ = ()
 
     def __setattr__(self, key: str, value: Any) -> type(None):
         """
@@ -209,21 +596,24 @@ class _BaseObject(metaclass=_BaseObjectMetaClass):
         @return: None (Doesnt work with "-> None").
         """
 
-        name = self.__class__.__name__
-        attribute_annotations = typing.get_type_hints(self.__class__)
+        name = type(self).__name__
+        attribute = _class_attributes(type(self)).get(key)
 
         # Check the attribute has been type-defined.
-        if key not in attribute_annotations:
+        if attribute is None:
             _handle_error(MissingAttributeTypeAnnotationException(f"Attribute '{name}.{key}' has no type annotation."))
+            attribute = (Any, None, False)
+        attribute_type, checker, is_const = attribute
 
-        # Check the attribute isn't const/final (allow setting in __init__).
-        if typing.get_origin(attribute_annotations[key]) is Const and inspect.stack()[1].function != "__init__":
+        # Check the attribute isn't const/final (allow setting in __init__). The caller's frame is only looked at for
+        # const attributes, so regular assignments don't pay for it.
+        if is_const and sys._getframe(1).f_code.co_name != "__init__":
             _handle_error(ConstModifierException(f"Attribute '{key}' is const and cannot be modified."))
 
         # Check the type of the attribute.
-        try: typeguard.check_type(value, attribute_annotations[key])
-        except typeguard.TypeCheckError: _handle_error(TypeMismatchException(f"Attribute '{name}.{key}' is not of type '{attribute_annotations[key].__name__}'."))
-        super().__setattr__(key, value)
+        if checker is not None and not checker(value):
+            _handle_error(TypeMismatchException(f"Attribute '{name}.{key}' is not of type '{_type_name(attribute_type)}'."))
+        object.__setattr__(self, key, value)
 
     def __getattribute__(self, item: str) -> Any:
         """
@@ -237,52 +627,54 @@ class _BaseObject(metaclass=_BaseObjectMetaClass):
         @return: The attribute or method.
         """
 
-        # Bypass magic method/attribute access and "inspect" code.
-        caller_context = inspect.currentframe().f_back
-        if _is_special_identifier(item) or caller_context.f_globals["__name__"] == "inspect":
-            return super().__getattribute__(item)
-
-        # Handle public member access.
-        if not item.startswith("_"):
-            return super().__getattribute__(item)
-
-        # Handle protected and private member access.
-        base_classes = super().__getattribute__("__class__").__mro__[:-1]
-        this_class_identifier = f"_{self.__class__.__name__}__"
-        private_identifier_regex = re.compile(r"^_[a-zA-Z0-9_]+[a-zA-Z0-9]__")
-
-        # Handle possible friended free function.
-        if "self" not in caller_context.f_locals:
-            free_function_name = caller_context.f_code.co_name
-            if free_function_name in super().__getattribute__("__friends__"):
-                return super().__getattribute__(private_identifier_regex.sub(this_class_identifier, item))
-                # return super().__getattribute__(item)
-
-        # Handle class access (matching class means access to all members).
-        if "self" in caller_context.f_locals:
-            is_same_class = caller_context.f_locals["self"].__class__ is self.__class__
-            if is_same_class:
-                return super().__getattribute__(item)
-
-        # Handle possible subclass access (protected only); note private looks like "_Type__member".
-        if "self" in caller_context.f_locals:
-            is_subclass = caller_context.f_locals["self"].__class__ in base_classes
-            if is_subclass and not item.removeprefix(f"_{self.__class__.__name__}").startswith("__"):
-                return super().__getattribute__(item)
-
-        # Handle possible friend class access (calling function belongs to a friend class).
-        if "self" in caller_context.f_locals:
-            caller_context_class_name = caller_context.f_locals["self"].__class__.__name__
-            if caller_context_class_name in super().__getattribute__("__friends__"):
-                return super().__getattribute__(private_identifier_regex.sub(this_class_identifier, item))
-
-        # Handle possible friend method access (calling function is a friend method).
-        if "self" in caller_context.f_locals:
-            caller_context_method_name = f"{caller_context.f_locals['self'].__class__.__name__}.{caller_context.f_code.co_name}"
-            if caller_context_method_name in super().__getattribute__("__friends__"):
-                return super().__getattribute__(private_identifier_regex.sub(this_class_identifier, item))
-
-        _handle_error(AccessModifierException(f"Access to protected/private member '{self.__class__.__name__}.{item}' is not allowed."))
+        # Handle public member access (the most common case) before any other work.
+        if not item or item[0] != "_":
+            return object.__getattribute__(self, item)
+
+        # Bypass magic method/attribute access (inlined special identifier check) and "inspect" code.
+        if len(item) >= 4 and item[1] == "_" and item[-1] == "_" and item[-2] == "_":
+            return object.__getattribute__(self, item)
+        caller_context = sys._getframe(1)
+        caller_module = caller_context.f_globals["__name__"]
+        if caller_module == "inspect":
+            return object.__getattribute__(self, item)
+
+        # Handle protected and private member access. The access data is defined on the class, so read it from the type.
+        this_class = type(self)
+        this_class_identifier = this_class.__private_prefix__
+
+        # Handle methods defined in this class, or in a base class (protected only), identified by the caller's code
+        # object, so the frame's locals don't need to be read. Code shared by several classes (ie classes made by the same
+        # factory function) has no single owner, so it is left to the checks on the caller's "self" below.
+        caller_code = caller_context.f_code
+        caller_code_owner = _CODE_OWNERS.get(id(caller_code))
+        if caller_code_owner is not None:
+            caller_code_class = caller_code_owner()
+            if caller_code_class is this_class or (caller_code_class in this_class.__protected_bases__ and not item.startswith(this_class_identifier)):
+                return object.__getattribute__(self, item)
+
+        # Read the caller's "self" once: the frame's locals are materialized on every "f_locals" access.
+        caller_self = caller_context.f_locals.get("self")
+        caller_class = type(caller_self) if caller_self is not None else None
+
+        # The remaining checks only depend on the caller's class, module and name, and the member, so each combination is
+        # decided once and cached on the class. The cache is nested by each of them, as hashing a tuple key on every access
+        # costs more than the nested dict lookups. It is cleared when it holds too many caller classes, so it can't keep
+        # them alive forever.
+        caller_name = caller_code.co_name
+        try:
+            member_name = this_class.__access_decisions__[caller_class][caller_module][caller_name][item]
+        except KeyError:
+            access_decisions = this_class.__access_decisions__
+            if caller_class not in access_decisions and len(access_decisions) >= _ACCESS_DECISIONS_LIMIT:
+                access_decisions.clear()
+            member_name = _resolve_member_access(this_class, item, caller_name, caller_module, caller_class)
+            access_decisions.setdefault(caller_class, {}).setdefault(caller_module, {}).setdefault(caller_name, {})[item] = member_name
+
+        if member_name is None:
+            _handle_error(AccessModifierException(f"Access to protected/private member '{this_class.__name__}.{item}' is not allowed."))
+            return None
+        return object.__getattribute__(self, member_name)
 
 
 class TypeChecker:
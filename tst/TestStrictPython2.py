@@ -1,5 +1,9 @@
 from __future__ import annotations
+import functools
+import gc
+import types
 import unittest
+import weakref
 import std
 
 
@@ -536,3 +540,336 @@ class TestStrictPython(unittest.TestCase):
 
         z = Z()
         z.method()
+
+    def test_const_attribute_set_in_constructor(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: std.Const[int]
+
+            def __init__(self) -> None:
+                self.attribute = 0
+
+        t = Test()
+        self.assertEqual(t.attribute, 0)
+
+    def test_const_attribute_modification(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: std.Const[int]
+
+            def __init__(self) -> None:
+                self.attribute = 0
+
+            def method(self) -> None:
+                self.attribute = 1
+
+        with self.assertRaises(std.ConstModifierException):
+            t = Test()
+            t.method()
+
+    def test_param_type_match_static_method_from_instance(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            @staticmethod
+            def method(param: int) -> int:
+                return param
+
+        t = Test()
+        self.assertEqual(t.method(0), 0)
+
+    def test_virtual_static_method_override(self) -> None:
+        class Base(std.TypeChecker.BaseObject):
+            @std.virtual_method
+            @staticmethod
+            def method() -> int:
+                return 0
+
+        class Derived(Base):
+            @std.override_method
+            @staticmethod
+            def method() -> int:
+                return 1
+
+        self.assertEqual(Derived.method(), 1)
+
+    def test_missing_parameter_annotation_after_cls(self) -> None:
+        with self.assertRaises(std.MissingParameterTypeAnnotationException):
+            class Test(std.TypeChecker.BaseObject):
+                @classmethod
+                def method(cls, param) -> None:
+                    pass
+
+    def test_friended_module_function_protected_access(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            _attribute: int
+            __friends__ = {f"{__name__}:function"}
+
+            def __init__(self) -> None:
+                self._attribute = 0
+
+        def function() -> int:
+            return Test()._attribute
+
+        self.assertEqual(function(), 0)
+
+    def test_friended_method_is_not_a_module_friend(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            _attribute: int
+            __friends__ = {"Other.function"}
+
+            def __init__(self) -> None:
+                self._attribute = 0
+
+        module = types.ModuleType("Other")
+        exec("def function(t):\n    return t._attribute", module.__dict__)
+        with self.assertRaises(std.AccessModifierException):
+            module.function(Test())
+
+    def test_factory_classes_private_access(self) -> None:
+        def make() -> type:
+            class Test(std.TypeChecker.BaseObject):
+                _attribute: int
+
+                def __init__(self) -> None:
+                    self._attribute = 0
+
+                def read(self, other: std.Any) -> int:
+                    return other._attribute
+
+            return Test
+
+        a, b = make()(), make()()
+        self.assertEqual(a.read(a), 0)
+        with self.assertRaises(std.AccessModifierException):
+            a.read(b)
+
+    def test_equal_code_in_other_module_protected_access(self) -> None:
+        module_a = types.ModuleType("module_a")
+        module_a.std = std
+        exec(compile(
+            "class Test(std.TypeChecker.BaseObject):\n"
+            "    _attribute: int\n"
+            "    def __init__(self) -> None:\n"
+            "        self._attribute = 0\n"
+            "    def read(self, other: std.Any) -> int:\n"
+            "        return other._attribute\n", "module_a.py", "exec"), module_a.__dict__)
+
+        module_b = types.ModuleType("module_b")
+        exec(compile(
+            "class Test:\n"
+            "    _attribute = None\n"
+            "    def __init__(self):\n"
+            "        self._attribute = 0\n"
+            "    def read(self, other):\n"
+            "        return other._attribute\n", "module_b.py", "exec"), module_b.__dict__)
+
+        self.assertEqual(module_b.Test.read.__code__, module_a.Test.read.__wrapped__.__code__)
+        with self.assertRaises(std.AccessModifierException):
+            module_b.Test().read(module_a.Test())
+
+    def test_return_type_mismatch_none(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            def function(self) -> None:
+                return 5
+
+        with self.assertRaises(std.TypeMismatchException):
+            Test().function()
+
+    def test_attribute_slots(self) -> None:
+        class Test(std.TypeChecker.BaseObject, slots=True):
+            attribute: int
+            default_attribute: int = 0
+
+            def __init__(self) -> None:
+                self.attribute = 0
+                self.default_attribute = 1
+
+        t = Test()
+        self.assertEqual(Test.__slots__, ("attribute", "__dict__"))
+        self.assertEqual(t.__dict__, {"default_attribute": 1})
+
+    def test_attributes_not_slotted_by_default(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: int
+
+            def __init__(self) -> None:
+                self.attribute = 0
+
+        t = Test()
+        self.assertEqual(t.__dict__, {"attribute": 0})
+        self.assertIs(weakref.ref(t)(), t)
+
+    def test_multiple_inheritance_annotated_bases(self) -> None:
+        class A(std.TypeChecker.BaseObject):
+            a: int
+
+        class B(std.TypeChecker.BaseObject):
+            b: int
+
+        class C(A, B):
+            def __init__(self) -> None:
+                self.a = 0
+                self.b = 1
+
+        c = C()
+        self.assertEqual((c.a, c.b), (0, 1))
+
+    def test_cached_property_annotated_class(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: int
+
+            def __init__(self) -> None:
+                self.attribute = 0
+
+            @functools.cached_property
+            def value(self) -> int:
+                return self.attribute + 1
+
+        self.assertEqual(Test().value, 1)
+
+    def test_param_default_type_mismatch_only_when_used(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            def function(self, a: int = None, *, b: int = None) -> int:
+                return 0
+
+        t = Test()
+        self.assertEqual(t.function(5, b=6), 0)
+        self.assertEqual(t.function(a=5, b=6), 0)
+        with self.assertRaises(std.TypeMismatchException):
+            t.function(5)
+        with self.assertRaises(std.TypeMismatchException):
+            t.function(b=6)
+        self.assertEqual(t.function(5, b=6), 0)
+
+    def test_attribute_type_mismatch(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: int
+
+            def __init__(self) -> None:
+                self.attribute = "string"
+
+        with self.assertRaises(std.TypeMismatchException):
+            Test()
+
+    def test_const_attribute_type_mismatch(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: std.Const[int]
+
+            def __init__(self) -> None:
+                self.attribute = "string"
+
+        with self.assertRaises(std.TypeMismatchException):
+            Test()
+
+    def test_param_type_match_optional(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            def function(self, a: int | None, b: std.Optional[float]) -> None:
+                pass
+
+        Test().function(1, 2)
+        Test().function(None, None)
+
+    def test_param_type_mismatch_optional(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            def function(self, a: int | None) -> None:
+                pass
+
+        with self.assertRaises(std.TypeMismatchException):
+            Test().function("string")
+
+    def test_unannotated_attribute_warning(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            attribute: int
+
+        std.TypeChecker.ErrorLevel = std.ErrorLevel.WARNING
+        try:
+            t = Test()
+            with self.assertWarns(Warning):
+                t.other = 0
+        finally:
+            std.TypeChecker.ErrorLevel = std.ErrorLevel.ERROR
+        self.assertEqual(t.other, 0)
+
+    def test_unannotated_method_not_wrapped(self) -> None:
+        std.TypeChecker.ErrorLevel = std.ErrorLevel.WARNING
+        try:
+            with self.assertWarns(Warning):
+                class Test(std.TypeChecker.BaseObject):
+                    def function(self, a):
+                        return a
+        finally:
+            std.TypeChecker.ErrorLevel = std.ErrorLevel.ERROR
+
+        self.assertFalse(hasattr(Test.function, "__wrapped__"))
+        self.assertEqual(Test().function(1), 1)
+
+    def test_repeated_access_decisions(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            _attribute: int
+            __friends__ = {"friend"}
+
+            def __init__(self) -> None:
+                self._attribute = 0
+
+        def friend(test: Test) -> int:
+            return test._attribute
+
+        def function(test: Test) -> int:
+            return test._attribute
+
+        t = Test()
+        for _ in range(2):
+            self.assertEqual(friend(t), 0)
+            with self.assertRaises(std.AccessModifierException):
+                function(t)
+
+    def test_access_decisions_per_module(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            _attribute: int
+            __friends__ = {"module_a:function"}
+
+            def __init__(self) -> None:
+                self._attribute = 0
+
+        module_a, module_b = types.ModuleType("module_a"), types.ModuleType("module_b")
+        for module in (module_a, module_b):
+            exec(compile("def function(t):\n    return t._attribute", f"{module.__name__}.py", "exec"), module.__dict__)
+        self.assertEqual(module_a.function.__code__, module_b.function.__code__)
+
+        t = Test()
+        self.assertEqual(module_a.function(t), 0)
+        with self.assertRaises(std.AccessModifierException):
+            module_b.function(t)
+
+    def test_runtime_class_collected(self) -> None:
+        def make() -> weakref.ref:
+            class Test(std.TypeChecker.BaseObject):
+                _attribute: int
+
+                def __init__(self) -> None:
+                    self._attribute = 0
+
+                def function(self, a: int) -> int:
+                    return self._attribute + a
+
+            Test().function(1)
+            return weakref.ref(Test)
+
+        reference = make()
+        gc.collect()
+        self.assertIsNone(reference())
+
+    def test_wrapper_does_not_share_cached_values(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            def function(self, a: int) -> int:
+                return a
+
+        Test().function(1)
+        self.assertIn("__strict_signature__", vars(Test.function.__wrapped__))
+        self.assertNotIn("__strict_signature__", vars(Test.function))
+
+    def test_param_type_mismatch_bool(self) -> None:
+        class Test(std.TypeChecker.BaseObject):
+            def function(self, a: bool) -> None:
+                pass
+
+        Test().function(True)
+        with self.assertRaises(std.TypeMismatchException):
+            Test().function(1)